@@ -1,37 +1,47 @@
 from pathlib import Path
+import atexit
 import logging
+import logging.handlers
 import sys
-import termcolor
 
-from ruamel.yaml import YAML
-
-yaml = YAML(typ="safe")
+# ANSI escape codes for coloring terminal output
+_RED = "\033[31m"
+_YELLOW = "\033[33m"
+_RESET = "\033[0m"
 
 
 class MyFormatter(logging.Formatter):
+    # Color to use for each log level; levels not listed here aren't colored
+    _COLORS = {
+        logging.CRITICAL: _RED,
+        logging.ERROR: _RED,
+        logging.WARNING: _YELLOW,
+    }
+
     def format(self, record: logging.LogRecord):
         txt = super().format(record)
-        if record.levelno >= logging.ERROR:
-            return termcolor.colored(txt, color="red")
-        elif record.levelno == logging.WARNING:
-            return termcolor.colored(txt, color="yellow")
-        else:
-            return txt
-
+        color = self._COLORS.get(record.levelno)
+        return f"{color}{txt}{_RESET}" if color else txt
 
-def configure_logging(config_path: Path) -> None:
-    """Configures the logging settings."""
-    with config_path.open("r") as f:
-        config = yaml.load(f)
 
+def configure_logging(config: dict, config_dir: Path) -> None:
+    """Configures the logging settings from an already-parsed config."""
     logfile = Path(config.get("logfile", "bardcore.log"))
     if not logfile.is_absolute():
-        logfile = config_path.parent / logfile
+        logfile = config_dir / logfile
     logfile.touch()
     file_format = logging.Formatter(fmt="%(asctime)s [%(levelname)s] %(message)s")
     file_handler = logging.FileHandler(logfile)
     file_handler.setFormatter(file_format)
     file_handler.setLevel(logging.DEBUG)
+    # Buffer records in memory, so we aren't writing to disk for every debug message
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    atexit.register(buffered_handler.flush)
 
     term_format = MyFormatter(fmt="%(levelname)s: %(message)s")
     term_handler = logging.StreamHandler(sys.stdout)
@@ -39,7 +49,7 @@ def configure_logging(config_path: Path) -> None:
     term_handler.setLevel(logging.WARNING)
 
     root_logger = logging.getLogger()
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(buffered_handler)
     root_logger.addHandler(term_handler)
     # Default level is Warning, irrespective the handler levels
     root_logger.setLevel(logging.DEBUG)
\ No newline at end of file
@@ -2,6 +2,7 @@ from pathlib import Path
 import sys
 import logging
 from difflib import get_close_matches
+from typing import Callable
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import NestedCompleter, FuzzyCompleter
@@ -16,6 +17,9 @@ from ._logging import configure_logging
 player: Player = None
 session = PromptSession()
 
+# '/play' completions only depend on the registered playables, so we build them once
+_play_completer_cache: dict[tuple[int, int], NestedCompleter] = {}
+
 
 def help():
     helptxt = (
@@ -60,6 +64,22 @@ def list_tracks(player: Player):
         print("  * " + track + suffix)
 
 
+def _build_play_completer() -> NestedCompleter:
+    """Builds the completions for the '/play' command, reusing them while the set of playables
+    is unchanged."""
+    key = (id(player.playables), len(player.playables))
+    if completer := _play_completer_cache.get(key):
+        return completer
+    play_dict = {}
+    for playable in player.playables.values():
+        play_dict[playable.name] = {
+            "- " + track: None for track in playable.tracks.keys()
+        }
+    completer = NestedCompleter.from_nested_dict(play_dict)
+    _play_completer_cache[key] = completer
+    return completer
+
+
 def build_completer():
     """Builds a map for auto completions when prompting the user for input."""
     logging.debug("Building auto-completion")
@@ -70,12 +90,8 @@ def build_completer():
         "/quit": None,
         "/list": None,
         "/vol": None,
-        "/play": {},
+        "/play": _build_play_completer(),
     }
-    for playable in player.playables.values():
-        completer_dict["/play"][playable.name] = {
-            "- " + track: None for track in playable.tracks.keys()
-        }
 
     if player.current_playable and isinstance(player.current_playable, Playable):
         completer_dict["/track"] = {track for track in player.list_tracks()}
@@ -110,17 +126,54 @@ def volume(vol: str) -> None:
     print(f"Volume is now set at {vol}%")
 
 
+# Sentinels returned by command handlers to signal the input loop
+QUIT = object()
+REBUILD_COMPLETER = object()
+
+
+def _play_command(args: str):
+    play(*[a.strip() for a in args.split("-")])
+    return REBUILD_COMPLETER
+
+
+def _quit_command(args: str):
+    player.stop(0)
+    return QUIT
+
+
+# Maps each command (and its shorthand) to a handler, which is passed the command's arguments
+COMMANDS: dict[str, Callable[[str], object]] = {
+    "/h": lambda args: help(),
+    "/help": lambda args: help(),
+    "/s": lambda args: player.stop(),
+    "/stop": lambda args: player.stop(),
+    "/t": lambda args: switch_track(args.strip()),
+    "/track": lambda args: switch_track(args.strip()),
+    "/p": _play_command,
+    "/play": _play_command,
+    "/l": lambda args: list_tracks(player),
+    "/list": lambda args: list_tracks(player),
+    "/v": volume,
+    "/vol": volume,
+    "/q": _quit_command,
+    "/quit": _quit_command,
+}
+
+
 def main():
     if len(sys.argv) != 2:
         print("Bardcore only accepts 1 argument: the path to the config file.")
         exit(1)
 
     fname = Path(sys.argv[1])
-    configure_logging(fname)
+    # Parse the config once, and share it between logging and player setup
+    cfg = config.read_config(fname)
+    configure_logging(cfg, fname.parent)
     logging.info("Starting program.")
+    logging.debug("Loading config from file '%s'", fname)
 
     global player
-    player = config.load_config(fname)
+    player = config.load_config_from_dict(cfg, fname.parent)
     print("Welcome to -- B A R D C O R E! --")
     completer = build_completer()
 
@@ -129,35 +182,23 @@ def main():
         prompt_text = "bardcore"
         modestr = ""
         if player.current_playable:
-            modestr = f"/{player.current_playable.current_track.name})"
+            if track := player.current_playable.current_track:
+                modestr = f"/{track.name})"
             prompt_text += f" ({player.current_playable.name}{modestr})"
         user_input: str = session.prompt(
             prompt_text + " > ", completer=completer, complete_while_typing=True
         )
         if not user_input:
             continue
-        idx = user_input.find(" ")
-        cmd = user_input[:idx].strip() if idx > 0 else user_input.strip()
-        args = user_input[idx:] if idx > 0 else ""
+        cmd, _, args = user_input.strip().partition(" ")
+        fn = COMMANDS.get(cmd)
         try:
-            match cmd:
-                case "/h" | "/help":
-                    help()
-                case "/s" | "/stop":
-                    player.stop()
-                case "/t" | "/track":
-                    switch_track(args.strip())
-                case "/p" | "/play":
-                    play(*[a.strip() for a in args.split("-")])
-                    completer = build_completer()
-                case "/l" | "/list":
-                    list_tracks(player)
-                case "/v" | "/vol":
-                    volume(args)
-                case "/q" | "/quit":
-                    player.stop(0)
-                    break
+            result = fn(args) if fn else None
+            if result is QUIT:
+                break
+            if result is REBUILD_COMPLETER:
+                completer = build_completer()
         except BaseException as e:
-            logging.error(f"Unhandled {e.__class__.__name__}: {e}")
+            logging.error("Unhandled %s: %s", e.__class__.__name__, e)
         print()
     logging.info("Exiting program.")
@@ -3,20 +3,33 @@
 import logging
 from pathlib import Path
 
-from ruamel.yaml import YAML
+import yaml
 
 from .errors import ConfigError
 from .player import Player
 from .tracks import Playable, Track, CompTrack, TrackList
 
-yaml = YAML(typ="safe")
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 
-def load_config(path) -> Player:
-    logging.debug(f"Loading config from file '{path}'")
+def read_config(path: Path) -> dict:
+    """Parses the config file, without building anything from it. Logging may not be set up yet
+    when this runs, so it doesn't log anything itself."""
     with path.open("r") as f:
-        config = yaml.load(f)
+        return yaml.load(f, Loader=_Loader)
 
+
+def load_config(path: Path) -> Player:
+    logging.debug("Loading config from file '%s'", path)
+    return load_config_from_dict(read_config(path), path.parent)
+
+
+def load_config_from_dict(config: dict, config_dir: Path) -> Player:
+    """Builds a Player from an already-parsed config. Relative paths in the config are taken to
+    be relative to 'config_dir'."""
     # Load named sound files
     #   We allow users to give names to sound files to make referencing them easier elsewhere in
     #   the config file.
@@ -25,7 +38,7 @@ def load_config(path) -> Player:
         # sounds_config should be a dict with sound aliases mapped to paths
         for alias, soundpath in sounds_config.items():
             named_sounds[alias] = Path(soundpath)
-    logging.debug(f"Loaded {len(named_sounds)} sounds from config.")
+    logging.debug("Loaded %d sounds from config.", len(named_sounds))
 
     # Load CompTracks & TrackLists
     playables: dict[str, Playable] = {}
@@ -37,9 +50,11 @@ def load_config(path) -> Player:
         for track_name, track_path in track_defns.items():
             if track_path in named_sounds:
                 track_path = named_sounds[track_path]
+            track_path = Path(track_path).expanduser()
             if not track_path.is_absolute():
-                track_path = path.parent / track_path
-            tracks.append(Track(track_name, track_path))
+                track_path = config_dir / track_path
+            # Canonicalize once here, so the path can be used directly as a cache key later
+            tracks.append(Track(track_name, track_path.resolve()))
         return tracks
 
     for name, defn in config.get("comp tracks", {}).items():
@@ -52,14 +67,15 @@ def load_config(path) -> Player:
             raise ConfigError(f"Multiple playables in config with name '{name}'")
         playables[name] = TrackList(name, load_config_tracks(defn))
 
-    logging.debug(f"Loaded {len(playables)} playable items")
+    logging.debug("Loaded %d playable items", len(playables))
 
     # Load other config items
     master_volume = config.get("master volume", 100)
     if not (0 <= master_volume <= 100):
         logging.warning(
             "Volume must be between 0 and 100! "
-            f"Ignoring value of '{master_volume}' and using 100 instead."
+            "Ignoring value of '%s' and using 100 instead.",
+            master_volume,
         )
         master_volume = 100
     # Convert to percentage
@@ -67,7 +83,7 @@ def load_config(path) -> Player:
 
     player = Player(master_volume=master_volume)
     for item in playables.values():
-        logging.debug(f"Registering playable from config: {item.name}")
+        logging.debug("Registering playable from config: %s", item.name)
         player.register_playable(item)
 
     logging.info("Finished loading config.")
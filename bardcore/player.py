@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from .tracks import Playable
 from .errors import NoSuchTrackError, NoTrackPlayingError
@@ -6,6 +7,14 @@ from . import util
 
 
 class Player:
+    __slots__ = (
+        "playables",
+        "current_playable",
+        "master_volume",
+        "_fade_thread",
+        "_fade_cancel",
+    )
+
     def __init__(self, master_volume: float = 1.0):
         """Creates a new Player object.
 
@@ -16,12 +25,18 @@ class Player:
         self.current_playable: Playable = None
         self.master_volume = master_volume
 
+        # Background thread running the crossfade between Playables, if any
+        self._fade_thread: threading.Thread = None
+        self._fade_cancel: threading.Event = threading.Event()
+
     def switch_track(self, track_name: str):
         """Switch the track of the current Playable."""
         if not self.current_playable:
             raise NoTrackPlayingError(
                 "Unable to switch tracks; nothing is currently playing"
             )
+        # Don't let a crossfade into this Playable fight the track switch's own fade
+        self._cancel_fade(finish=True)
         self.current_playable.play(track_name)
 
     def list_tracks(self) -> list[str]:
@@ -56,11 +71,12 @@ class Player:
         if not self.current_playable:
             logging.debug("Nothing to stop. Skipping.")
             return
+        self._cancel_fade()
         playable = self.current_playable
-        logging.debug(f"Stopping track '{playable.name}'...")
+        logging.debug("Stopping track '%s'...", playable.name)
         playable.stop(fade_dur)
         self.current_playable = None
-        logging.debug(f"Track '{playable.name}' stopped.")
+        logging.debug("Track '%s' stopped.", playable.name)
 
     def play(self, playable_name: str, track_name: str = "", fade_dur: float = 2.5):
         """Play a specific Playable and Track.
@@ -73,10 +89,16 @@ class Player:
         target_playable = self.playables.get(playable_name)
         if not target_playable:
             raise NoSuchTrackError(playable_name)
+        # Finish any crossfade still running first, so it can't stop the target once started
+        self._cancel_fade()
         # If nothing is currently playing
         if not self.current_playable:
             target_playable.play(track_name, vol=self.master_volume)
-        # If something is playing:
+        # If the target is already playing, there's nothing to crossfade from; it handles the
+        #   switch (if any) itself
+        elif target_playable is self.current_playable:
+            target_playable.play(track_name, vol=self.master_volume)
+        # If something else is playing:
         else:
             # Start playing the other track, but explicitly set all modes to 0 volume
             target_track = None
@@ -84,17 +106,52 @@ class Player:
             target_track = target_playable.current_track
             current_track = None
             current_track = self.current_playable.current_track
-            util.fade_sounds(
-                current_track.sound, target_track.sound, fade_dur, self.master_volume
+            # Crossfade in the background, so control returns to the prompt right away
+            self._fade_thread = threading.Thread(
+                target=self._fade_and_stop,
+                args=(
+                    current_track.sound,
+                    target_track.sound,
+                    fade_dur,
+                    self.master_volume,
+                    self.current_playable,
+                ),
+                daemon=True,
             )
-            self.current_playable.stop()
+            self._fade_thread.start()
         self.current_playable = target_playable
 
+    def _fade_and_stop(
+        self,
+        down_sound,
+        up_sound,
+        fade_dur: float,
+        vol: float,
+        old_playable: Playable,
+    ):
+        """Crossfades between two sounds, then stops the Playable being faded out."""
+        util.fade_sounds(down_sound, up_sound, fade_dur, vol, cancel=self._fade_cancel)
+        # The old sound is already silent, so there's no need to fade it again
+        old_playable.stop(0)
+
+    def _cancel_fade(self, finish: bool = False):
+        """Interrupts any crossfade still in progress and waits for it to finish. If 'finish' is
+        set, the track being faded in jumps straight to the master volume."""
+        if not self._fade_thread:
+            return
+        self._fade_cancel.set()
+        self._fade_thread.join()
+        self._fade_cancel.clear()
+        self._fade_thread = None
+        if finish and (track := self.current_playable.current_track):
+            track.sound.set_volume(self.master_volume)
+
     def register_playable(self, playable: Playable):
         self.playables[playable.name] = playable
 
     def set_volume(self, volume: float = 1.0):
         """Sets the master volume of the player, affecting any sounds played."""
+        self._cancel_fade()
         self.master_volume = volume
         if self.current_playable:
             if track := self.current_playable.current_track:
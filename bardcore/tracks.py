@@ -1,8 +1,9 @@
 """Code for representing each musical track."""
 
-from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
+import queue
 import random
 import threading
 
@@ -18,9 +19,8 @@ _sound_objects: dict[Path, mixer.Sound] = {}
 
 
 def get_sound(path: Path) -> mixer.Sound:
-    """Loads a Sound object from disk."""
+    """Loads a Sound object from disk. The path should already be absolute and resolved."""
     # First, check if it's already loaded
-    path = path.expanduser().absolute()
     if sound := _sound_objects.get(path):
         return sound
     # Else, load it
@@ -32,6 +32,8 @@ def get_sound(path: Path) -> mixer.Sound:
 class Track:
     """Tracks represent single sound files."""
 
+    __slots__ = ("name", "path", "sound")
+
     def __init__(self, name: str, path: Path):
         """Creates a Track.
 
@@ -48,9 +50,9 @@ class Track:
 
     def load(self):
         """Load the music from the sound file."""
-        logging.debug(f"Loading sound '{self.path.name}' from filesystem...")
+        logging.debug("Loading sound '%s' from filesystem...", self.path.name)
         self.sound = get_sound(self.path)
-        logging.debug(f"Finished loading '{self.path.name}'.")
+        logging.debug("Finished loading '%s'.", self.path.name)
 
     def play(self, initial_volume: float = 1, loops: int = 0):
         """Start playing the track.
@@ -68,9 +70,11 @@ class Track:
         self.sound.play(loops - 1)
 
 
-class Playable(ABC):
+class Playable:
     """Playable objects act as managers and containers for groups of tracks."""
 
+    __slots__ = ("name", "tracks", "is_playing", "current_track")
+
     def __init__(self, name: str, tracks: list[Track]):
         self.name = name
 
@@ -82,30 +86,39 @@ class Playable(ABC):
         # Reference to the track currently being played
         self.current_track: Track | None = None
 
-        # Preload tracks
+        # Preload tracks. Loading is mostly disk I/O, so we can load several files at once.
+        #   Only load one track per file in parallel, since two threads loading the same file
+        #   would both miss the _sound_objects cache; the rest share its Sound afterwards.
+        first_tracks: dict[Path, Track] = {}
         for track in tracks:
-            track.load()
+            first_tracks.setdefault(track.path, track)
+        if first_tracks:
+            with ThreadPoolExecutor(max_workers=min(8, len(first_tracks))) as executor:
+                # Consume the results so any loading errors are raised here
+                list(executor.map(Track.load, first_tracks.values()))
+        for track in tracks:
+            track.sound = first_tracks[track.path].sound
 
-    @abstractmethod
     def play(self, track_name: str, vol: float = 1) -> None:
         """This function should begin playing the track list, starting with 'track_name'. If the
         track list is already playing, and another track is currently playing, then it should
         should switch to playing the new track. It should also be able to set the initial volume of
         the target track."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def stop(self, fade_dur: float) -> None:
         """This function should stop the currently-playing track, and set self.is_playing to
         false. it should also accept a 'fade_dur' paramater, defining how long the fade out
         transition should be."""
-        pass
+        raise NotImplementedError
 
 
 class CompTrack(Playable):
     """A CompTrack object represent a "composite track", where multiple tracks are kept in sync,
     and you can swap out which one is playing at any given time."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, tracks: list[Track]) -> None:
         """Create a new CompTrack object.
 
@@ -129,7 +142,7 @@ class CompTrack(Playable):
             KeyError if there is no track with this name.
         """
         target_track = (
-            self.tracks[track_name] if track_name else list(self.tracks.values())[0]
+            self.tracks[track_name] if track_name else next(iter(self.tracks.values()))
         )
 
         # If different mode is already playing, switch to it
@@ -148,7 +161,7 @@ class CompTrack(Playable):
 
         # If no sounds are playing
         else:
-            logging.debug(f"Playing CompTrack '{self.name}'")
+            logging.debug("Playing CompTrack '%s'", self.name)
             # Play modes
             for track in self.tracks.values():
                 # Play the other modes with volume = 0, so they're all in sync
@@ -157,21 +170,33 @@ class CompTrack(Playable):
 
         self.is_playing = True
         self.current_track = (
-            target_track or self.current_track or list(self.tracks.values())[0]
+            target_track or self.current_track or next(iter(self.tracks.values()))
         )
 
     def stop(self, fade_dur: float = -1):
         """Stop the current track. Optionally fade out over a given duration."""
         self.is_playing = False
+        # The current track is stopped by fade_sounds once it has faded out
         util.fade_sounds(self.current_track.sound, None, fade_dur)
         for track in self.tracks.values():
-            track.sound.stop()
+            if track is not self.current_track:
+                track.sound.stop()
 
 
 class TrackList(Playable):
+    __slots__ = ("thread", "play_queue", "idle_event", "started_event", "stop_event")
+
     def __init__(self, name: str, tracks: list[Track]):
-        # Thread that manages playing the next song in the playlist
+        # Thread that manages playing the next song in the playlist. It's started on the first
+        #   play, then kept around and reused for later plays.
         self.thread: threading.Thread = None
+        # Queue of play requests (kwargs for play_async) for the thread to pick up
+        self.play_queue: queue.Queue = queue.Queue()
+        # Set whenever the thread isn't playing anything
+        self.idle_event: threading.Event = threading.Event()
+        self.idle_event.set()
+        # Set once the thread has picked the first song of a play request (or given up on it)
+        self.started_event: threading.Event = threading.Event()
         self.stop_event: threading.Event = threading.Event()
 
         super().__init__(name, tracks)
@@ -197,15 +222,34 @@ class TrackList(Playable):
                 )
             else:
                 logging.info(
-                    "Cannot start TrackList '{self.name}' because it is already playing"
+                    "Cannot start TrackList '%s' because it is already playing",
+                    self.name,
                 )
             return
-        self.thread = threading.Thread(target=self.play_async, kwargs=kwargs)
-        self.thread.start()
-        # NOTE: It might be possible (though I haven't seen it) that the thread could start, but
-        #   control returns to the console before the async thread sets the current_track variable.
-        #   if this becomes an issue, we should set up an Event indicating that the thread has
-        #   finished setting up, and only return from this function once the event is triggered.
+        if not self.thread:
+            self.thread = threading.Thread(target=self.run_worker, daemon=True)
+            self.thread.start()
+        self.is_playing = True
+        self.idle_event.clear()
+        self.started_event.clear()
+        self.play_queue.put(kwargs)
+        # Wait for the thread to set current_track, so callers can use it as soon as we return
+        self.started_event.wait()
+
+    def run_worker(self):
+        """Plays each request from the play queue in turn. Runs for the life of the program."""
+        while True:
+            kwargs = self.play_queue.get()
+            try:
+                self.play_async(**kwargs)
+            except Exception:
+                # Keep the worker alive, otherwise later plays would wait on it forever
+                logging.exception("TrackList '%s' failed while playing", self.name)
+            finally:
+                self.is_playing = False
+                # In case play_async failed before it could start a song
+                self.started_event.set()
+                self.idle_event.set()
 
     def play_async(
         self,
@@ -215,7 +259,7 @@ class TrackList(Playable):
         shuffle: bool = False,
     ):
         # Make a copy of the list, so we can shuffle it and not alter the original
-        songs: list[Track] = [t for t in self.tracks.values()]
+        songs: list[Track] = list(self.tracks.values())
         if shuffle:
             random.shuffle(songs)
 
@@ -224,11 +268,12 @@ class TrackList(Playable):
             track = self.tracks.get(track_name)
             if not track:
                 logging.error(
-                    f"TrackList '{self.name}' has no track named '{track_name}'"
+                    "TrackList '%s' has no track named '%s'", self.name, track_name
                 )
-                self.thread = None
+                self.started_event.set()
                 return
-            songs.insert(0, songs.pop(songs.index(track)))
+            idx = songs.index(track)
+            songs[0], songs[idx] = songs[idx], songs[0]
 
         # Play songs
         n_iter = 0
@@ -237,37 +282,26 @@ class TrackList(Playable):
             for song in songs:
                 song.play(initial_volume=vol)
                 self.current_track = song
+                self.started_event.set()
                 # Wait for a stop event, or until the song is finished
                 self.stop_event.wait(timeout=song.sound.get_length())
                 # Check if we actually stopped
                 if self.stop_event.is_set():
+                    # This also stops the song once it has faded out
                     util.fade_sounds(song.sound, None, tspan=self.stop_event.fade_dur)
                     self.stop_event.clear()
-                    song.sound.stop()
                     return
                 else:
                     song.sound.stop()
 
     def stop(self, fade_dur: float = 2.5):
-        logging.info(f"Stopping playlist '{self.name}'...")
+        logging.info("Stopping playlist '%s'...", self.name)
         if self.is_playing:
-            logging.debug("Sending STOP event to '{self.name}'")
+            logging.debug("Sending STOP event to '%s'", self.name)
             self.stop_event.fade_dur = (
                 fade_dur  # Feels like this is bad practice but meh
             )
             self.stop_event.set()
-            logging.debug(f"Waiting for {self.name}'s thread to join...")
-            self.thread.join()
-            logging.debug(f"{self.name}'s thread joined successfully!")
-            self.thread = None
-
-    @property
-    def is_playing(self):
-        return self.thread is not None
-
-    @is_playing.setter
-    def is_playing(self, val):
-        if not val:
-            self.stop()
-        else:
-            self.play()
+            logging.debug("Waiting for %s's thread to finish playing...", self.name)
+            self.idle_event.wait()
+            logging.debug("%s's thread finished successfully!", self.name)
@@ -1,19 +1,48 @@
+import threading
 import time
+
 from pygame import mixer
 
+# Seconds between volume updates during a fade
+FADE_STEP = 0.02
+
 
 def fade_sounds(
-    down_sound: mixer.Sound, up_sound: mixer.Sound, tspan: float = 5.0, vol: float = 1.0
+    down_sound: mixer.Sound,
+    up_sound: mixer.Sound,
+    tspan: float = 5.0,
+    vol: float = 1.0,
+    cancel: threading.Event = None,
 ):
-    tnow = time.time()
-    frac = 0
+    """Fades 'down_sound' out and 'up_sound' up to 'vol' over 'tspan' seconds.
+
+    If there is no sound to fade up, the mixer fades 'down_sound' out natively and stops it, and
+    we return immediately. Otherwise both sounds are already playing (e.g. kept in sync in a
+    CompTrack), so we ramp their volumes here, which blocks until the fade is done.
+    """
+    if not up_sound:
+        if tspan > 0:
+            down_sound.fadeout(int(tspan * 1000))
+        else:
+            down_sound.stop()
+        return
+
     init_vol = down_sound.get_volume()
-    while frac < 1 and tspan > 0:
-        if down_sound:
-            down_sound.set_volume((1 - frac) * init_vol)
-        if up_sound:
-            up_sound.set_volume(frac * vol)
-        frac = (time.time() - tnow) / tspan
+    if tspan > 0:
+        # Step the volume at a fixed interval, sleeping in between, rather than spinning
+        n_steps = max(1, int(tspan / FADE_STEP))
+        for i in range(1, n_steps + 1):
+            frac = i / n_steps
+            if down_sound:
+                down_sound.set_volume((1 - frac) * init_vol)
+            if up_sound:
+                up_sound.set_volume(frac * vol)
+            if cancel:
+                # Leave the volumes where they are if the fade is interrupted
+                if cancel.wait(tspan / n_steps):
+                    return
+            else:
+                time.sleep(tspan / n_steps)
     if down_sound:
         down_sound.set_volume(0)
     if up_sound: